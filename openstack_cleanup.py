@@ -34,7 +34,11 @@
 
 from abc import ABCMeta, abstractmethod
 import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
+import random
 import re
 import sys
 import time
@@ -45,6 +49,7 @@ from tabulate import tabulate
 try:
     import openstack
     from openstack import exceptions as os_exceptions
+    from keystoneauth1.session import TCPKeepAliveAdapter
 except ImportError:
     print("❌ ERROR: OpenStack SDK is required but not available.")
     print("   Please install it with: pip install openstacksdk")
@@ -58,6 +63,67 @@ DEFAULT_VOLUME_DETACH_EXTRA_RETRIES = 5
 DEFAULT_LB_RETRY_DELAY = 10
 DEFAULT_ROUTER_FIP_WAIT = 5
 DEFAULT_INSTANCE_DELETE_RETRIES = 30
+DEFAULT_STACK_DELETE_POLL_INTERVAL = 1
+DEFAULT_STACK_DELETE_TIMEOUT = 600
+DEFAULT_POLL_INITIAL_DELAY = 0.25
+DEFAULT_POLL_MAX_DELAY = 4
+DEFAULT_BACKOFF_MAX_DELAY = 30
+DEFAULT_DELETE_CONCURRENCY = 8
+MIN_DELETE_CONCURRENCY = 2
+MAX_DELETE_CONCURRENCY = 16
+# A filter without any of these is a plain substring, see compile_filter()
+REGEX_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+# Big enough for MAX_DELETE_CONCURRENCY workers to keep their connections alive
+DEFAULT_HTTP_POOL_CONNECTIONS = 16
+DEFAULT_HTTP_POOL_MAXSIZE = 32
+DEFAULT_HTTP_CONNECT_RETRIES = 3
+# Port device_owner values of the interfaces attaching a router to its subnets
+ROUTER_INTERFACE_OWNERS = ('network:router_interface', 'network:router_interface_distributed',
+                           'network:ha_router_replicated_interface')
+# 'export VAR=value' lines in openrc files, the value may be single or double quoted.
+# Quoted values stop at the end of the line, so an unbalanced quote can't swallow the next exports
+OPENRC_EXPORT_RE = re.compile(r'^[ \t]*export[ \t]+(\w+)=(?:"([^"\n]*)"|\'([^\'\n]*)\'|(\S*))', re.M)
+
+# ============================================================================ #
+# Output - what the cleaners report while they work                            #
+# ============================================================================ #
+
+# Cleanup progress goes through this logger, see setup_logging()
+LOG = logging.getLogger('cleanup')
+
+class PhaseBufferedHandler(logging.StreamHandler):
+    """Stream handler that only flushes after every line on a terminal.
+
+    StreamHandler flushes the stream after each record. When the output is
+    piped to a file or a CI log nobody reads it line by line, so the lines
+    pile up in the stream's buffer and get written when a cleanup phase ends.
+    """
+
+    def __init__(self, stream):
+        super(PhaseBufferedHandler, self).__init__(stream)
+        self.interactive = stream.isatty()
+
+    def flush(self):
+        if self.interactive:
+            super(PhaseBufferedHandler, self).flush()
+
+    def flush_phase(self):
+        super(PhaseBufferedHandler, self).flush()
+
+def setup_logging():
+    """Send cleanup progress to stdout as plain lines (safe to call more than once)."""
+    if LOG.handlers:
+        return
+    handler = PhaseBufferedHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    LOG.addHandler(handler)
+    LOG.setLevel(logging.INFO)
+    LOG.propagate = False
+
+def flush_log():
+    """Write out whatever cleanup progress is still buffered."""
+    for handler in LOG.handlers:
+        getattr(handler, 'flush_phase', handler.flush)()
 
 # ============================================================================ #
 # Credentials - handling OpenStack authentication the easy way                 #
@@ -76,6 +142,7 @@ class Credentials:
         self.openrc_file = openrc_file
         self.cloud_name = cloud_name
         self.rc_auth_url = None
+        self._conn = None
         
         # Load openrc file if we have one
         if openrc_file and os.path.exists(openrc_file):
@@ -92,16 +159,9 @@ class Credentials:
         """Parse openrc file and load environment variables."""
         try:
             with open(openrc_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('export '):
-                        # Handle export statements: export VAR=value
-                        line = line[7:]  # Strip 'export '
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            # Clean up quotes
-                            value = value.strip('"\'')
-                            os.environ[key] = value
+                content = f.read()
+            for key, double_quoted, single_quoted, bare in OPENRC_EXPORT_RE.findall(content):
+                os.environ[key] = double_quoted or single_quoted or bare.strip('"\'')
         except Exception as e:
             print(f'Failed to load openrc file {openrc_file}: {e}')
     
@@ -135,6 +195,19 @@ class Credentials:
         Returns:
             keystoneauth1.session.Session: Ready to use session
         """
+        return self.get_connection().session
+
+    def get_connection(self):
+        """Get an authenticated connection to talk to OpenStack.
+
+        The connection is built on the first call and returned again after that,
+        so every cleaner shares its session, connection pool and proxies.
+
+        Returns:
+            openstack.connection.Connection: Ready to use connection
+        """
+        if self._conn is not None:
+            return self._conn
         try:
             # If we have a specific cloud name, use it
             if self.cloud_name:
@@ -143,7 +216,9 @@ class Credentials:
                 # Let the SDK figure out the auth details
                 # It handles everything: app creds, passwords, tokens, clouds.yaml, etc.
                 conn = openstack.connect()
-            return conn.session
+            self._mount_connection_pool(conn)
+            self._conn = conn
+            return conn
         except Exception as e:
             print(f'Failed to create OpenStack session: {e}')
             if self.cloud_name:
@@ -151,66 +226,90 @@ class Credentials:
                 print("Expected locations: ~/.config/openstack/clouds.yaml or ./clouds.yaml")
             raise
 
-# Global regex pattern for matching resource names
-resource_name_re = None
+    def _mount_connection_pool(self, conn):
+        """Give the shared HTTP session a connection pool sized for parallel deletes.
+
+        Every service proxy goes through the same keystoneauth session, so this
+        keeps TLS connections alive and reused instead of reconnecting per request.
+        Uses keystoneauth's TCP keepalive adapter, the one it mounts by default.
+        """
+        adapter = TCPKeepAliveAdapter(pool_connections=DEFAULT_HTTP_POOL_CONNECTIONS,
+                                      pool_maxsize=DEFAULT_HTTP_POOL_MAXSIZE,
+                                      max_retries=DEFAULT_HTTP_CONNECT_RETRIES)
+        conn.session.session.mount('https://', adapter)
+        conn.session.session.mount('http://', adapter)
 
 class ResourceMonitor:
     """Watch resources being deleted and verify they're actually gone."""
+
+    # How to GET a single resource of each type (raises ResourceNotFound once it's gone)
+    _GETTERS = {
+        'INSTANCE': lambda conn, res_id: conn.compute.get_server(res_id),
+        'SERVER': lambda conn, res_id: conn.compute.get_server(res_id),
+        'FLAVOR': lambda conn, res_id: conn.compute.get_flavor(res_id),
+        'VOLUME': lambda conn, res_id: conn.block_storage.get_volume(res_id),
+        'SNAPSHOT': lambda conn, res_id: conn.block_storage.get_snapshot(res_id),
+        'NETWORK': lambda conn, res_id: conn.network.get_network(res_id),
+        'ROUTER': lambda conn, res_id: conn.network.get_router(res_id),
+        'PORT': lambda conn, res_id: conn.network.get_port(res_id),
+        'SECURITY_GROUP': lambda conn, res_id: conn.network.get_security_group(res_id),
+        'LOAD BALANCER': lambda conn, res_id: conn.load_balancer.get_load_balancer(res_id),
+        'IMAGE': lambda conn, res_id: conn.image.get_image(res_id),
+    }
+
+    # How to LIST all resources of each type
+    _LISTERS = {
+        'LOAD BALANCER': lambda conn: conn.load_balancer.load_balancers(),
+        'INSTANCE': lambda conn: conn.compute.servers(),
+        'SERVER': lambda conn: conn.compute.servers(),
+        'NETWORK': lambda conn: conn.network.networks(),
+        'ROUTER': lambda conn: conn.network.routers(),
+        'PORT': lambda conn: conn.network.ports(),
+        'VOLUME': lambda conn: conn.block_storage.volumes(),
+    }
     
-    def __init__(self, session, dryrun=False):
-        self.session = session
+    def __init__(self, conn, dryrun=False):
         self.dryrun = dryrun
         
-        # Get our OpenStack connection
-        self.conn = openstack.connection.Connection(session=session)
+        # Shared OpenStack connection
+        self.conn = conn
     
-    def verify_resource_deleted(self, resource_type, resource_id, max_attempts=10, delay=2):
-        """Double-check that a resource is actually gone."""
-        if self.dryrun:
+    def verify_resource_deleted(self, resource_type, resource_id, max_attempts=10,
+                                delay=DEFAULT_POLL_INITIAL_DELAY):
+        """Double-check that a resource is actually gone.
+
+        Checks right away, then backs off exponentially between attempts.
+        The result is printed as one line, since several deletions may be
+        verified at the same time from different threads.
+        """
+        getter = self._GETTERS.get(resource_type.upper())
+        if self.dryrun or getter is None:
             return True
             
-        print(f"    🔍 Verifying {resource_type} {resource_id[:8]}... deletion", end='', flush=True)
+        line = f"    🔍 Verifying {resource_type} {resource_id[:8]}... deletion"
         
         for attempt in range(max_attempts):
             try:
-                time.sleep(delay)
-                
                 # Try to get the resource - if it exists, it's not deleted yet
-                if resource_type.upper() in ['INSTANCE', 'SERVER']:
-                    self.conn.compute.get_server(resource_id)
-                elif resource_type.upper() == 'FLAVOR':
-                    self.conn.compute.get_flavor(resource_id)
-                elif resource_type.upper() == 'VOLUME':
-                    self.conn.block_storage.get_volume(resource_id)
-                elif resource_type.upper() == 'SNAPSHOT':
-                    self.conn.block_storage.get_snapshot(resource_id)
-                elif resource_type.upper() == 'NETWORK':
-                    self.conn.network.get_network(resource_id)
-                elif resource_type.upper() == 'ROUTER':
-                    self.conn.network.get_router(resource_id)
-                elif resource_type.upper() == 'PORT':
-                    self.conn.network.get_port(resource_id)
-                elif resource_type.upper() == 'SECURITY_GROUP':
-                    self.conn.network.get_security_group(resource_id)
-                elif resource_type.upper() == 'LOAD BALANCER':
-                    self.conn.load_balancer.get_load_balancer(resource_id)
-                elif resource_type.upper() == 'IMAGE':
-                    self.conn.image.get_image(resource_id)
-                        
-                # Still here? Resource exists, keep waiting
-                print('.', end='', flush=True)
+                getter(self.conn, resource_id)
+
+                # Still here? Resource exists, keep waiting - unless that was the last check
+                line += '.'
+                if attempt < max_attempts - 1:
+                    time.sleep(delay)
+                    delay = min(delay * 2, DEFAULT_POLL_MAX_DELAY)
                 
             except os_exceptions.ResourceNotFound:
                 # Perfect! Resource is gone
-                print(' ✅ DELETED')
+                LOG.info(f'{line} ✅ DELETED')
                 return True
             except Exception as e:
                 # Something else happened, probably means it's gone
-                print(f' ⚠️  UNKNOWN ({str(e)[:30]}...)')
+                LOG.info(f'{line} ⚠️  UNKNOWN ({str(e)[:30]}...)')
                 return True
                 
         # Ran out of attempts
-        print(' ⏰ TIMEOUT (may still be deleting)')
+        LOG.info(f'{line} ⏰ TIMEOUT (may still be deleting)')
         return False
     
     def watch_bulk_deletion(self, resource_list, resource_type):
@@ -218,68 +317,59 @@ class ResourceMonitor:
         if self.dryrun or not resource_list:
             return
             
-        print(f"    🔍 Monitoring {len(resource_list)} {resource_type.lower()} deletion(s)...")
+        # One LIST per poll tells us about every resource, instead of a GET each
+        lister = self._LISTERS.get(resource_type.upper())
+        if lister is None:
+            return
+
+        LOG.info(f"    🔍 Monitoring {len(resource_list)} {resource_type.lower()} deletion(s)...")
         
         remaining = list(resource_list)
         start_time = time.time()
         max_wait = 300  # Don't wait forever
+        delay = DEFAULT_POLL_INITIAL_DELAY
         
         while remaining and (time.time() - start_time) < max_wait:
+            try:
+                existing_ids = {res.id for res in lister(self.conn)}
+            except Exception as e:
+                # Can't list them, nothing more we can check
+                LOG.info(f"      ⚠️  Could not list {resource_type.lower()}s: {str(e)[:50]}")
+                return
+
             still_remaining = []
-            
             for resource_id, resource_name in remaining:
-                try:
-                    # Check if each resource still exists
-                    if resource_type.upper() == 'LOAD BALANCER':
-                        self.conn.load_balancer.get_load_balancer(resource_id)
-                        still_remaining.append((resource_id, resource_name))
-                    elif resource_type.upper() in ['INSTANCE', 'SERVER']:
-                        self.conn.compute.get_server(resource_id)
-                        still_remaining.append((resource_id, resource_name))
-                    elif resource_type.upper() == 'NETWORK':
-                        self.conn.network.get_network(resource_id)
-                        still_remaining.append((resource_id, resource_name))
-                    elif resource_type.upper() == 'ROUTER':
-                        self.conn.network.get_router(resource_id)
-                        still_remaining.append((resource_id, resource_name))
-                    elif resource_type.upper() == 'PORT':
-                        self.conn.network.get_port(resource_id)
-                        still_remaining.append((resource_id, resource_name))
-                    elif resource_type.upper() == 'VOLUME':
-                        self.conn.block_storage.get_volume(resource_id)
-                        still_remaining.append((resource_id, resource_name))
-                        
-                except os_exceptions.ResourceNotFound:
+                if resource_id in existing_ids:
+                    still_remaining.append((resource_id, resource_name))
+                else:
                     # Gone! Good news
-                    print(f"      ✅ {resource_name[:50]} - DELETED")
-                except Exception:
-                    # Can't access it, probably gone
-                    pass
+                    LOG.info(f"      ✅ {resource_name[:50]} - DELETED")
             
             if len(still_remaining) != len(remaining):
-                print(f"      📊 {len(remaining) - len(still_remaining)} deleted, {len(still_remaining)} remaining")
+                LOG.info(f"      📊 {len(remaining) - len(still_remaining)} deleted, {len(still_remaining)} remaining")
             
             remaining = still_remaining
             
             if remaining:
-                time.sleep(3)
+                time.sleep(delay)
+                delay = min(delay * 2, DEFAULT_POLL_MAX_DELAY)
         
         if remaining:
-            print(f"      ⏰ Timeout: {len(remaining)} {resource_type.lower()}(s) may still be deleting")
+            LOG.info(f"      ⏰ Timeout: {len(remaining)} {resource_type.lower()}(s) may still be deleting")
         else:
-            print(f"      🎉 All {resource_type.lower()}(s) successfully deleted!")
+            LOG.info(f"      🎉 All {resource_type.lower()}(s) successfully deleted!")
 
-# Global regex pattern gets set by main()
-resource_name_re = None
-
-def is_not_found_error(exception):
-    """Check if an exception represents a 'not found' error."""
-    return "NotFound" in str(type(exception)) or "404" in str(exception)
+def backoff_delay(attempt):
+    """Seconds to wait before retry number `attempt` (1-based), doubling with jitter."""
+    return min(DEFAULT_BACKOFF_MAX_DELAY, 2 ** attempt) * (0.5 + random.random())
 
 def is_conflict_error(exception):
     """Check if an exception represents a conflict error."""
-    return ("ConflictException" in str(type(exception)) or "409" in str(exception) or
-            "Conflict" in str(type(exception)))
+    return isinstance(exception, os_exceptions.ConflictException)
+
+def is_in_use_error(exception):
+    """Check if an exception says the resource is still in use, by exception type or by message."""
+    return is_conflict_error(exception) or "in use" in str(exception).lower()
 
 def prompt_to_run(auto_approve=False):
     print("Warning: You didn't specify a resource list file as the input. "
@@ -292,9 +382,13 @@ def prompt_to_run(auto_approve=False):
         sys.exit(0)
 
 def fetch_resources(fetcher, options=None):
-    """Get OpenStack resources with some basic error handling."""
+    """Stream OpenStack resources with some basic error handling.
+
+    Resources are yielded page by page as the SDK fetches them, so callers
+    can filter without holding the whole project listing in memory.
+    """
     try:
-        return fetcher(search_opts=options) if options else fetcher()
+        yield from (fetcher(search_opts=options) if options else fetcher())
     except Exception as e:
         error_msg = str(e)
         if "403" in error_msg or "Forbidden" in error_msg:
@@ -304,12 +398,36 @@ def fetch_resources(fetcher, options=None):
             print('❌ Authentication failed: Unable to discover OpenStack endpoints')
         elif not any(keyword in error_msg.lower() for keyword in ['forbidden', '403', 'unauthorized', '401']):
             print(f'⚠️  Warning: Exception while listing resources: {error_msg}')
-        return []
 
-def build_resource_dict(res_list):
-    """Turn a list of resources into a nice ID->name dictionary."""
+def simplify_filter(pattern):
+    """Drop a leading and trailing '.*' from a filter pattern.
+
+    Matching uses search(), which scans the whole name anyway, so the
+    wildcards only add backtracking work on long names and descriptions.
+    """
+    if pattern.startswith('.*') and pattern[2:3] not in ('?', '+'):
+        pattern = pattern[2:]
+    if pattern.endswith('.*'):
+        # Leave escaped dots alone, e.g. 'name\.*'
+        backslashes = len(pattern[:-2]) - len(pattern[:-2].rstrip('\\'))
+        if backslashes % 2 == 0:
+            pattern = pattern[:-2]
+    return pattern
+
+def build_resource_dict(res_list, name_re, objects=None):
+    """Turn a list of resources into a nice ID->name dictionary.
+
+    Only resources whose name or description matches name_re are kept.
+
+    If an objects dict is given, matched resources are also stored there by ID,
+    so cleaners can use the listed data without fetching each resource again.
+    """
     resources = {}
+    # Bind the matcher once, this loop can run over thousands of resources
+    search = name_re.search
     for res in res_list:
+        # Floating IPs are also matched on their bare address and their ID
+        extra_keys = ()
         try:
             resid = res.id
             resname = getattr(res, 'name', resid)
@@ -318,6 +436,7 @@ def build_resource_dict(res_list):
             # Special handling for floating IPs since they're a bit different
             if hasattr(res, 'floating_ip_address'):
                 resname = res.floating_ip_address
+                extra_keys = (resname, resid)
                 if resdesc:
                     truncated_desc = resdesc[:50] + "..." if len(resdesc) > 50 else resdesc
                     resname += f" (desc: {truncated_desc})"
@@ -331,22 +450,30 @@ def build_resource_dict(res_list):
             # Floating IPs in dict format
             if 'floating_ip_address' in res:
                 resname = res['floating_ip_address']
+                extra_keys = (resname, resid)
                 if resdesc:
                     truncated_desc = resdesc[:50] + "..." if len(resdesc) > 50 else resdesc
                     resname += f" (desc: {truncated_desc})"
         
         # Include resource if name or description matches our pattern
-        if resname and (resource_name_re.search(resname) or 
-                       (resdesc and resource_name_re.search(resdesc))):
+        if resname and (search(resname) or (resdesc and search(resdesc)) or
+                        any(search(str(key)) for key in extra_keys)):
             resources[resid] = resname
+            if objects is not None:
+                objects[resid] = res
     return resources
 
 class AbstractCleaner(metaclass=ABCMeta):
 
-    def __init__(self, res_category, res_desc, resources, dryrun):
+    def __init__(self, res_category, res_desc, resources, dryrun, name_re,
+                 delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
         self.dryrun = dryrun
         self.category = res_category
+        self._name_re = name_re
+        self.delete_concurrency = delete_concurrency
         self.resources = {}
+        # Full resource objects from discovery (not available for cleanup log entries)
+        self.resource_objects = {}
         if not resources:
             print(f'Discovering {res_category} resources...')
         for rtype, fetch_args in res_desc.items():
@@ -354,17 +481,35 @@ class AbstractCleaner(metaclass=ABCMeta):
                 self.resources[rtype] = resources[rtype]
             else:
                 res_list = fetch_resources(*fetch_args)
-                self.resources[rtype] = build_resource_dict(res_list)
+                self.resource_objects[rtype] = {}
+                self.resources[rtype] = build_resource_dict(res_list, name_re, self.resource_objects[rtype])
 
     def report_deletion(self, rtype, name):
         status = "(but is not deleted: dry run)" if self.dryrun else "is successfully deleted"
-        print(f'    + {rtype} {name} {status}')
+        LOG.info(f'    + {rtype} {name} {status}')
 
     def report_not_found(self, rtype, name):
-        print(f'    ? {rtype} {name} not found (already deleted?)')
+        LOG.info(f'    ? {rtype} {name} not found (already deleted?)')
 
     def report_error(self, rtype, name, reason):
-        print(f'    - {rtype} {name} ERROR: {reason}')
+        LOG.info(f'    - {rtype} {name} ERROR: {reason}')
+
+    def report_progress(self, message):
+        LOG.info(f'    . {message}')
+
+    def _parallel_delete(self, items, delete_fn):
+        """Call delete_fn(id, name) for each item, several at a time.
+
+        Deletes are independent API calls that mostly wait on the network,
+        so a small thread pool gets through large groups much faster.
+        """
+        items = list(items)
+        if not items:
+            return
+        workers = min(self.delete_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Drain the results so an unexpected exception isn't silently lost
+            list(executor.map(lambda item: delete_fn(*item), items))
 
     def get_resource_list(self):
         result = []
@@ -378,77 +523,82 @@ class AbstractCleaner(metaclass=ABCMeta):
         pass
 
 class StorageCleaner(AbstractCleaner):
-    def __init__(self, sess, resources, dryrun):
-        self.conn = openstack.connection.Connection(session=sess)
+    def __init__(self, conn, resources, dryrun, name_re, delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
+        self.conn = conn
         
         def volumes_fetcher():
-            return list(self.conn.block_storage.volumes())
+            return self.conn.block_storage.volumes()
             
         def snapshots_fetcher():
-            return list(self.conn.block_storage.snapshots())
+            return self.conn.block_storage.snapshots()
 
         res_desc = {
             'volumes': [volumes_fetcher],
             'volume_snapshots': [snapshots_fetcher]
         }
             
-        super(StorageCleaner, self).__init__('Storage', res_desc, resources, dryrun)
+        super(StorageCleaner, self).__init__('Storage', res_desc, resources, dryrun,
+                                             name_re, delete_concurrency)
 
     def clean(self):
-        print('*** STORAGE cleanup')
+        LOG.info('*** STORAGE cleanup')
         
-        # Delete volumes (instances should be deleted first, so all volumes can be safely deleted)
-        try:
-            for id, name in self.resources['volumes'].items():
-                try:
-                    if self.dryrun:
-                        self.conn.block_storage.get_volume(id)
-                        self.report_deletion('VOLUME', name)
-                    else:
-                        self.conn.block_storage.delete_volume(id)
-                        self.report_deletion('VOLUME', name)
-                except os_exceptions.ResourceNotFound:
-                    self.report_not_found('VOLUME', name)
-                except Exception as e:
-                    self.report_error('VOLUME', name, str(e))
-        except KeyError:
-            pass
+        # Delete volumes (instances should be deleted first, so all volumes can be safely deleted).
+        # Cinder has no bulk delete, so volumes go through the thread pool instead
+        self._parallel_delete(self.resources.get('volumes', {}).items(), self._delete_volume)
 
         # Clean up volume snapshots
+        self._parallel_delete(self.resources.get('volume_snapshots', {}).items(), self._delete_snapshot)
+
+    def _delete_volume(self, id, name):
+        """Delete a single volume and report what happened."""
         try:
-            for id, name in self.resources['volume_snapshots'].items():
-                try:
-                    if self.dryrun:
-                        self.conn.block_storage.get_snapshot(id)
-                        self.report_deletion('VOLUME SNAPSHOT', name)
-                    else:
-                        self.conn.block_storage.delete_snapshot(id)
-                        self.report_deletion('VOLUME SNAPSHOT', name)
-                except os_exceptions.ResourceNotFound:
-                    self.report_not_found('VOLUME SNAPSHOT', name)
-                except Exception as e:
-                    self.report_error('VOLUME SNAPSHOT', name, str(e))
-        except KeyError:
-            pass
+            if self.dryrun:
+                # Discovery just listed it, only cleanup log entries need checking
+                if 'volumes' not in self.resource_objects:
+                    self.conn.block_storage.get_volume(id)
+            else:
+                self.conn.block_storage.delete_volume(id)
+            self.report_deletion('VOLUME', name)
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('VOLUME', name)
+        except Exception as e:
+            self.report_error('VOLUME', name, str(e))
+
+    def _delete_snapshot(self, id, name):
+        """Delete a single volume snapshot and report what happened."""
+        try:
+            if self.dryrun:
+                # Discovery just listed it, only cleanup log entries need checking
+                if 'volume_snapshots' not in self.resource_objects:
+                    self.conn.block_storage.get_snapshot(id)
+            else:
+                self.conn.block_storage.delete_snapshot(id)
+            self.report_deletion('VOLUME SNAPSHOT', name)
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('VOLUME SNAPSHOT', name)
+        except Exception as e:
+            self.report_error('VOLUME SNAPSHOT', name, str(e))
 
 class ComputeCleaner(AbstractCleaner):
-    def __init__(self, sess, resources, dryrun):
-        self.conn = openstack.connection.Connection(session=sess)
+    def __init__(self, conn, resources, dryrun, name_re, delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
+        self.conn = conn
+        self.deleted_instances = 0  # Instances actually deleted by clean()
         
         def instances_fetcher():
-            return list(self.conn.compute.servers())
+            return self.conn.compute.servers()
             
         def flavors_fetcher():
-            return list(self.conn.compute.flavors())
+            return self.conn.compute.flavors()
             
         def keypairs_fetcher():
-            return list(self.conn.compute.keypairs())
+            return self.conn.compute.keypairs()
             
         def images_fetcher():
             try:
-                return list(self.conn.image.images())
+                yield from self.conn.image.images()
             except Exception:
-                return []
+                return
 
         res_desc = {
             'instances': [instances_fetcher],
@@ -457,17 +607,32 @@ class ComputeCleaner(AbstractCleaner):
             'images': [images_fetcher]
         }
         
-        super(ComputeCleaner, self).__init__('Compute', res_desc, resources, dryrun)
+        super(ComputeCleaner, self).__init__('Compute', res_desc, resources, dryrun,
+                                             name_re, delete_concurrency)
 
     def clean(self):
-        print('*** COMPUTE cleanup')
+        LOG.info('*** COMPUTE cleanup')
         
         # Clean instances with their floating IPs
         deleting_instances = dict(self.resources['instances'])
+
+        # List floating IPs once and look them up by address for every instance
+        self._fip_index = {}
+        if not self.dryrun and self.resources['instances']:
+            try:
+                self._fip_index = {fip.floating_ip_address: fip for fip in self.conn.network.ips()}
+            except Exception as e:
+                LOG.info(f'    . Could not list floating IPs: {str(e)}')
+
+        instance_objs = self.resource_objects.get('instances', {})
+        get_server = self.conn.compute.get_server
+        delete_server = self.conn.compute.delete_server
         for ins_id, ins_name in self.resources['instances'].items():
             try:
-                # Get instance and its floating IPs
-                instance = self.conn.compute.get_server(ins_id)
+                # Get instance and its floating IPs, discovery usually listed it already
+                instance = instance_objs.get(ins_id)
+                if instance is None:
+                    instance = get_server(ins_id)
                 fips = self._get_instance_floating_ips(instance) if instance else []
                 
                 if self.dryrun:
@@ -478,23 +643,23 @@ class ComputeCleaner(AbstractCleaner):
                     # Delete floating IPs first
                     self._delete_floating_ips(fips)
                     # Delete instance
-                    self.conn.compute.delete_server(ins_id)
+                    delete_server(ins_id)
+                    self.deleted_instances += 1
                     
+            except os_exceptions.ResourceNotFound:
+                deleting_instances.pop(ins_id, None)
+                self.report_not_found('INSTANCE', ins_name)
             except Exception as e:
-                if "NotFound" in str(type(e)) or "404" in str(e):
-                    deleting_instances.pop(ins_id, None)
-                    self.report_not_found('INSTANCE', ins_name)
-                else:
-                    self.report_error('INSTANCE', ins_name, str(e))
+                self.report_error('INSTANCE', ins_name, str(e))
 
         # Wait for instance deletion to complete
         if not self.dryrun and deleting_instances:
             self._wait_for_instance_deletion(deleting_instances)
 
         # Clean other compute resources
-        self._clean_flavors()
-        self._clean_keypairs()
-        self._clean_images()
+        self._delete_group('flavors', 'FLAVOR', self.conn.compute.delete_flavor)
+        self._delete_group('keypairs', 'KEYPAIR', self.conn.compute.delete_keypair, use_name=True)
+        self._delete_group('images', 'IMAGE', self.conn.image.delete_image)
 
     def _get_instance_floating_ips(self, instance):
         """Extract floating IP addresses from instance."""
@@ -509,24 +674,22 @@ class ComputeCleaner(AbstractCleaner):
 
     def _delete_floating_ips(self, fip_addresses):
         """Delete floating IPs by their addresses."""
-        if not fip_addresses:
-            return
-            
-        fip_lst = list(self.conn.network.ips())
+        delete_ip = self.conn.network.delete_ip
         for fip_addr in fip_addresses:
-            for fip_obj in fip_lst:
-                if fip_obj.floating_ip_address == fip_addr:
-                    try:
-                        self.conn.network.delete_ip(fip_obj.id)
-                        self.report_deletion('FLOATING IP', fip_addr)
-                    except Exception as e:
-                        self.report_error('FLOATING IP', fip_addr, str(e))
-                    break
+            fip_obj = self._fip_index.get(fip_addr)
+            if fip_obj is None:
+                continue
+            try:
+                delete_ip(fip_obj.id)
+                self.report_deletion('FLOATING IP', fip_addr)
+            except Exception as e:
+                self.report_error('FLOATING IP', fip_addr, str(e))
 
     def _wait_for_instance_deletion(self, deleting_instances):
         """Wait for instances to finish deleting - sometimes they take a while."""
-        print(f'    . Waiting for {len(deleting_instances)} instances to be fully deleted...')
+        LOG.info(f'    . Waiting for {len(deleting_instances)} instances to be fully deleted...')
         retry_count = DEFAULT_INSTANCE_DELETE_RETRIES  # Don't wait forever
+        get_server = self.conn.compute.get_server
         
         while deleting_instances and retry_count > 0:
             retry_count -= 1
@@ -534,79 +697,53 @@ class ComputeCleaner(AbstractCleaner):
             
             for ins_id in instances_to_check:
                 try:
-                    self.conn.compute.get_server(ins_id)
-                except Exception as e:
-                    if "NotFound" in str(type(e)) or "404" in str(e):
-                        ins_name = deleting_instances.pop(ins_id)
-                        self.report_deletion('INSTANCE', ins_name)
+                    get_server(ins_id)
+                except os_exceptions.ResourceNotFound:
+                    ins_name = deleting_instances.pop(ins_id)
+                    self.report_deletion('INSTANCE', ins_name)
+                except Exception:
+                    pass
             
             if deleting_instances and retry_count > 0:
                 time.sleep(2)
         
         if deleting_instances:
-            print(f'    . Warning: {len(deleting_instances)} instances may still be deleting')
+            LOG.info(f'    . Warning: {len(deleting_instances)} instances may still be deleting')
 
-    def _clean_flavors(self):
-        """Clean up flavors."""
-        for flavor_id, flavor_name in self.resources['flavors'].items():
-            try:
-                if self.dryrun:
-                    self.report_deletion('FLAVOR', flavor_name)
-                else:
-                    self.conn.compute.delete_flavor(flavor_id)
-                    self.report_deletion('FLAVOR', flavor_name)
-            except Exception as e:
-                if "NotFound" in str(type(e)) or "404" in str(e):
-                    self.report_not_found('FLAVOR', flavor_name)
-                else:
-                    self.report_error('FLAVOR', flavor_name, str(e))
+    def _delete_group(self, key, label, deleter, use_name=False):
+        """Delete every resource of one type with the given SDK delete call.
 
-    def _clean_keypairs(self):
-        """Clean up keypairs."""
-        for keypair_id, keypair_name in self.resources['keypairs'].items():
+        Keypairs are deleted by name, everything else by ID.
+        """
+        def delete_one(res_id, res_name):
             try:
-                if self.dryrun:
-                    self.report_deletion('KEYPAIR', keypair_name)
-                else:
-                    self.conn.compute.delete_keypair(keypair_name)
-                    self.report_deletion('KEYPAIR', keypair_name)
+                if not self.dryrun:
+                    deleter(res_name if use_name else res_id)
+                self.report_deletion(label, res_name)
+            except os_exceptions.ResourceNotFound:
+                self.report_not_found(label, res_name)
             except Exception as e:
-                if "NotFound" in str(type(e)) or "404" in str(e):
-                    self.report_not_found('KEYPAIR', keypair_name)
-                else:
-                    self.report_error('KEYPAIR', keypair_name, str(e))
+                self.report_error(label, res_name, str(e))
 
-    def _clean_images(self):
-        """Clean up images."""
-        for image_id, image_name in self.resources['images'].items():
-            try:
-                if self.dryrun:
-                    self.report_deletion('IMAGE', image_name)
-                else:
-                    self.conn.image.delete_image(image_id)
-                    self.report_deletion('IMAGE', image_name)
-            except Exception as e:
-                if "NotFound" in str(type(e)) or "404" in str(e):
-                    self.report_not_found('IMAGE', image_name)
-                else:
-                    self.report_error('IMAGE', image_name, str(e))
+        self._parallel_delete(self.resources[key].items(), delete_one)
 
 class NetworkCleaner(AbstractCleaner):
 
-    def __init__(self, sess, resources, dryrun):
-        self.conn = openstack.connection.Connection(session=sess)
+    def __init__(self, conn, resources, dryrun, name_re, delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
+        self.conn = conn
+        self.deleted_instances = None  # Will be set by OpenStackCleaners, None means unknown
         
         def networks_fetcher():
-            return list(self.conn.network.networks())
+            return self.conn.network.networks()
 
         def routers_fetcher():
-            return list(self.conn.network.routers())
+            return self.conn.network.routers()
 
         def secgroup_fetcher():
-            return list(self.conn.network.security_groups())
+            return self.conn.network.security_groups()
             
         def floating_ips_fetcher():
-            return list(self.conn.network.ips())
+            return self.conn.network.ips()
 
         res_desc = {
             'floating_ips': [floating_ips_fetcher],
@@ -614,7 +751,12 @@ class NetworkCleaner(AbstractCleaner):
             'networks': [networks_fetcher],
             'routers': [routers_fetcher]
         }
-        super(NetworkCleaner, self).__init__('Network', res_desc, resources, dryrun)
+        super(NetworkCleaner, self).__init__('Network', res_desc, resources, dryrun,
+                                             name_re, delete_concurrency)
+
+    def set_deleted_instances(self, count):
+        """Tell the cleaner how many instances the compute cleanup just deleted"""
+        self.deleted_instances = count
 
     def remove_router_interface(self, router_id, port):
         """Clean up router interface the hard way."""
@@ -640,15 +782,42 @@ class NetworkCleaner(AbstractCleaner):
                 self.conn.network.delete_ip(fip_id)
                 description_info = f" (desc: {fip_description[:DEFAULT_DESCRIPTION_TRUNCATE_LENGTH]}...)" if fip_description else ""
                 self.report_deletion('FLOATING IP', f"{fip_ip}{description_info}")
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('FLOATING IP', fip_ip)
         except Exception as e:
-            if "NotFound" in str(type(e)) or "404" in str(e):
-                self.report_not_found('FLOATING IP', fip_ip)
-            else:
-                self.report_error('FLOATING IP', fip_ip, str(e))
+            self.report_error('FLOATING IP', fip_ip, str(e))
+
+    def _find_router_floating_ips(self, router_id):
+        """Find the floating IPs that are attached through a router.
+
+        Neutron filters floating IPs by router_id server side. If a cloud
+        rejects that filter, fall back to scanning every floating IP.
+        """
+        net = self.conn.network
+        try:
+            return list(net.ips(router_id=router_id))
+        except os_exceptions.BadRequestException:
+            pass
+
+        router_fips = []
+        for fip in net.ips():
+            if getattr(fip, 'router_id', None) == router_id:
+                router_fips.append(fip)
+            elif getattr(fip, 'port_id', None):
+                # Is this floating IP on a port that belongs to our router?
+                device_id = self._port_devices.get(fip.port_id)
+                if device_id is None:
+                    # Not in the cached listing (or the listing failed) - ask for the port
+                    try:
+                        device_id = net.get_port(fip.port_id).device_id
+                    except Exception:
+                        pass
+                if device_id == router_id:
+                    router_fips.append(fip)
+        return router_fips
 
     def clean(self):
-        print('*** NETWORK cleanup')
-        global resource_name_re
+        LOG.info('*** NETWORK cleanup')
 
         # Store security groups for later (delete them last)
         security_groups_to_delete = []
@@ -659,345 +828,383 @@ class NetworkCleaner(AbstractCleaner):
         except KeyError:
             pass
 
-        # 1. First clean up discovered floating IPs (the ones we found during discovery)
+        # List ports once - the port sweep, routers and networks all work from this listing
         try:
-            for id, name in self.resources.get('floating_ips', {}).items():
-                try:
-                    fip = self.conn.network.get_ip(id)
-                    self._delete_floating_ip(fip)
-                except Exception as e:
-                    if "NotFound" in str(type(e)) or "404" in str(e):
-                        self.report_not_found('FLOATING IP', name)
-                    else:
-                        self.report_error('FLOATING IP', name, str(e))
-        except KeyError:
-            pass
+            all_ports = list(self.conn.network.ports())
+        except Exception as e:
+            LOG.info(f'    . Could not list ports: {str(e)}')
+            all_ports = []
+        self._deleted_port_ids = set()
+        self._deleted_router_ids = set()
+        self._port_devices = {port.id: port.device_id for port in all_ports}
 
-        # 2. Extra sweep for any floating IPs we might have missed
-        try:
-            all_floating_ips = list(self.conn.network.ips())
-                
-            for fip in all_floating_ips:
-                fip_id = fip.id
-                fip_ip = fip.floating_ip_address
-                fip_description = getattr(fip, 'description', '') or ''
+        # 1. First clean up discovered floating IPs (the ones we found during discovery)
+        self._parallel_delete(self.resources.get('floating_ips', {}).items(),
+                              self._delete_listed_floating_ip)
+
+        search = self._name_re.search
+
+        # 2. Extra sweep for any floating IPs we might have missed. Only needed when they
+        #    came from a cleanup log, discovery already matched every floating IP on the
+        #    same address, ID and description
+        if 'floating_ips' not in self.resource_objects:
+            try:
+                processed_fips = self.resources.get('floating_ips', {})
+                # Walk the listing page by page rather than loading every floating IP up front
+                for fip in self.conn.network.ips():
+                    fip_id = fip.id
+                    fip_ip = fip.floating_ip_address
+                    fip_description = getattr(fip, 'description', '') or ''
                 
-                # Skip ones we already processed
-                if fip_id in self.resources.get('floating_ips', {}):
-                    continue
+                    # Skip ones we already processed
+                    if fip_id in processed_fips:
+                        continue
                 
-                # See if this one matches our pattern
-                if (resource_name_re.search(str(fip_ip)) or 
-                    resource_name_re.search(str(fip_id)) or
-                    resource_name_re.search(str(fip_description))):
-                    self._delete_floating_ip(fip)
-        except Exception as e:
-            print(f'    . Could not list additional floating IPs: {str(e)}')
+                    # See if this one matches our pattern
+                    if (search(str(fip_ip)) or
+                        search(str(fip_id)) or
+                        search(str(fip_description))):
+                        self._delete_floating_ip(fip)
+            except Exception as e:
+                LOG.info(f'    . Could not list additional floating IPs: {str(e)}')
 
         # 3. Look for ports that match our pattern and clean them up too
+        matching_ports = [port for port in all_ports if search(port.name or '') or search(port.id)]
+        ports_to_delete = []
+        for port in matching_ports:
+            # Skip system ports (they get handled by their parent resources)
+            if port.device_owner not in ['network:router_interface', 'network:dhcp', 'network:router_gateway']:
+                ports_to_delete.append((port.id, port.name))
+            else:
+                LOG.info(f'    . Skipping {port.device_owner} port {port.name}')
+        self._parallel_delete(ports_to_delete, self._delete_port)
+
+        # Index the ports that are left by router and by network
+        self._ports_by_device = defaultdict(list)
+        self._ports_by_network = defaultdict(list)
+        for port in all_ports:
+            if port.id not in self._deleted_port_ids:
+                self._ports_by_device[port.device_id].append(port)
+                self._ports_by_network[port.network_id].append(port)
+
+        # Each phase finishes before the next starts: routers must be gone before their networks
+        self._parallel_delete(self.resources.get('routers', {}).items(), self._delete_router)
+        # Deleting a router also removes its interface, HA and DVR ports, drop them from the index
+        if self._deleted_router_ids:
+            for network_id, ports in self._ports_by_network.items():
+                self._ports_by_network[network_id] = [port for port in ports
+                                                      if port.device_id not in self._deleted_router_ids]
+        self._parallel_delete(self.resources.get('networks', {}).items(), self._delete_network)
+
+        # Delete security groups last (after instances are gone)
+        if security_groups_to_delete:
+            # Only worth waiting if instances were just deleted and may still hold their groups
+            if not self.dryrun and self.deleted_instances != 0:
+                LOG.info('    . Waiting a moment for instances to be fully deleted...')
+                time.sleep(5)  # Give instances time to be fully deleted
+
+            # A dry run only needs to know the groups exist, check them all with one listing
+            self._existing_sg_ids = None
+            if self.dryrun:
+                self._existing_sg_ids = self._list_security_group_ids()
+
+            self._parallel_delete(security_groups_to_delete, self._delete_security_group)
+
+    def _list_security_group_ids(self):
+        """Get the IDs of all security groups, or None if they can't be listed."""
+        if 'sec_groups' in self.resource_objects:
+            # Discovery just listed them
+            return set(self.resource_objects['sec_groups'])
         try:
-            all_ports = list(self.conn.network.ports())
-                
-            for port in all_ports:
-                port_id = port.id
-                port_name = port.name
-                
-                # Does this port match what we're looking for?
-                if resource_name_re.search(str(port_name)) or resource_name_re.search(str(port_id)):
-                    try:
-                        device_owner = port.device_owner
-                        
-                        # Skip system ports (they get handled by their parent resources)
-                        if device_owner not in ['network:router_interface', 'network:dhcp', 'network:router_gateway']:
-                            if self.dryrun:
-                                self.report_deletion('PORT', port_name)
-                            else:
-                                self.conn.network.delete_port(port_id)
-                                self.report_deletion('PORT', port_name)
-                        else:
-                            print(f'    . Skipping {device_owner} port {port_name}')
-                    except Exception as e:
-                        if "NotFound" in str(type(e)) or "404" in str(e):
-                            self.report_not_found('PORT', port_name)
-                        else:
-                            self.report_error('PORT', port_name, str(e))
+            return {sg.id for sg in self.conn.network.security_groups(fields='id')}
+        except Exception:
+            # Check each group on its own instead
+            return None
+
+    def _delete_listed_floating_ip(self, id, name):
+        """Look up a floating IP we already know about and delete it."""
+        try:
+            fip = self.conn.network.get_ip(id)
+            self._delete_floating_ip(fip)
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('FLOATING IP', name)
         except Exception as e:
-            print(f'    . Could not list ports: {str(e)}')
+            self.report_error('FLOATING IP', name, str(e))
 
+    def _delete_port(self, port_id, port_name):
+        """Delete a port that matched the filter."""
         try:
-            for id, name in self.resources['routers'].items():
+            if self.dryrun:
+                self.report_deletion('PORT', port_name)
+            else:
+                self.conn.network.delete_port(port_id)
+                self._deleted_port_ids.add(port_id)
+                self.report_deletion('PORT', port_name)
+        except os_exceptions.ResourceNotFound:
+            self._deleted_port_ids.add(port_id)
+            self.report_not_found('PORT', port_name)
+        except Exception as e:
+            self.report_error('PORT', port_name, str(e))
+
+    def _delete_router(self, id, name):
+        """Detach everything from a router and delete it."""
+        net = self.conn.network
+        try:
+            if self.dryrun:
+                router = net.get_router(id)
+                if router.external_gateway_info:
+                    self.report_deletion('Router Gateway', name)
+
+                interface_ips = [port.fixed_ips[0]['ip_address'] for port in self._router_interfaces(id)]
+                if interface_ips:
+                    self.report_deletion('Router Interfaces',
+                                         f"{len(interface_ips)} interfaces ({', '.join(interface_ips)})")
+            else:
+                router = net.get_router(id)
+                
+                # First thing - find any floating IPs hanging around this router
+                self.report_progress(f'Checking for floating IPs on router {name}...')
+                router_fips = []
                 try:
-                    if self.dryrun:
-                        self.conn.network.get_router(id)
-                        self.report_deletion('Router Gateway', name)
-                        
-                        port_list = list(self.conn.network.ports(device_id=id))
-                            
-                        for port in port_list:
-                            if port.fixed_ips:
-                                self.report_deletion('Router Interface', port.fixed_ips[0]['ip_address'])
-                    else:
-                        router = self.conn.network.get_router(id)
-                        
-                        # First thing - find any floating IPs hanging around this router
-                        print(f'    . Checking for floating IPs on router {name}...')
+                    router_fips = self._find_router_floating_ips(id)
+                    
+                    # Get rid of those floating IPs first
+                    for fip in router_fips:
                         try:
-                            all_floating_ips = list(self.conn.network.ips())
-                            router_fips = []
-                            for fip in all_floating_ips:
-                                if (hasattr(fip, 'router_id') and fip.router_id == id) or \
-                                   (hasattr(fip, 'port_id') and fip.port_id):
-                                    # Is this floating IP on a port that belongs to our router?
-                                    try:
-                                        port = self.conn.network.get_port(fip.port_id)
-                                        if port.device_id == id:
-                                            router_fips.append(fip)
-                                    except:
-                                        pass
-                            
-                            # Get rid of those floating IPs first
-                            for fip in router_fips:
-                                try:
-                                    print(f'    . Deleting floating IP {fip.floating_ip_address} attached to router...')
-                                    self.conn.network.delete_ip(fip.id)
-                                    self.report_deletion('FLOATING IP', fip.floating_ip_address)
-                                except Exception as e:
-                                    print(f'    . Could not delete floating IP {fip.floating_ip_address}: {str(e)}')
-                                    
+                            self.report_progress(f'Deleting floating IP {fip.floating_ip_address} attached to router...')
+                            net.delete_ip(fip.id)
+                            self.report_deletion('FLOATING IP', fip.floating_ip_address)
                         except Exception as e:
-                            print(f'    . Could not list floating IPs: {str(e)}')
-                        
-                        # Give floating IPs a moment to fully disappear
-                        if router_fips:
-                            print('    . Waiting for floating IPs to be fully released...')
-                            time.sleep(DEFAULT_ROUTER_FIP_WAIT)
-                        
-                        # Now remove the gateway (should work better without floating IPs)
-                        if router.external_gateway_info:
-                            try:
-                                self.conn.network.update_router(id, external_gateway_info=None)
-                                self.report_deletion('Router Gateway', name)
-                            except Exception as e:
-                                print(f'    . Could not remove router gateway: {str(e)}')
-                                # Keep going anyway
-                        
-                        # Remove interfaces
-                        port_list = list(self.conn.network.ports(device_id=id))
+                            self.report_progress(f'Could not delete floating IP {fip.floating_ip_address}: {str(e)}')
                             
-                        for port in port_list:
-                            # For SDK, remove interfaces by subnet
-                            if port.fixed_ips:
-                                try:
-                                    self.conn.network.remove_interface_from_router(
-                                        id, subnet_id=port.fixed_ips[0]['subnet_id']
-                                    )
-                                except Exception:
-                                    pass  # Interface might already be removed
-                        
-                        # Delete the router
-                        self.conn.network.delete_router(id)
-                    self.report_deletion('ROUTER', name)
                 except Exception as e:
-                    if "NotFound" in str(type(e)) or "404" in str(e):
-                        self.report_not_found('ROUTER', name)
-                    elif "Conflict" in str(type(e)) or "409" in str(e):
-                        self.report_error('ROUTER', name, f'Conflict (may have dependencies): {str(e)}')
-                    else:
-                        self.report_error('ROUTER', name, str(e))
-        except KeyError:
-            pass
-        try:
-            for id, name in self.resources['networks'].items():
-                retry_count = 3
-                while retry_count > 0:
+                    self.report_progress(f'Could not list floating IPs: {str(e)}')
+                
+                # Give floating IPs a moment to fully disappear
+                if router_fips:
+                    self.report_progress('Waiting for floating IPs to be fully released...')
+                    time.sleep(DEFAULT_ROUTER_FIP_WAIT)
+                
+                # Now remove the gateway (should work better without floating IPs)
+                if router.external_gateway_info:
                     try:
-                        if self.dryrun:
-                            self.conn.network.get_network(id)
-                            self.report_deletion('NETWORK', name)
-                            break
-                        else:
-                            # Let's see what ports are still hanging around and clean up what we can
-                            try:
-                                remaining_ports = list(self.conn.network.ports(network_id=id))
-                                if remaining_ports:
-                                    print(f'    . Network {name} has {len(remaining_ports)} remaining ports, checking...')
-                                    for port in remaining_ports:
-                                        # Don't mess with system ports (they get cleaned up by their owners)
-                                        if port.device_owner in ['network:dhcp', 'network:router_interface', 
-                                                               'network:router_gateway', 'network:floatingip']:
-                                            continue
-                                        # Try to clean up the stragglers
-                                        try:
-                                            print(f'    . Deleting remaining port {port.name or port.id}...')
-                                            self.conn.network.delete_port(port.id)
-                                        except Exception as e:
-                                            print(f'    . Could not delete port {port.id}: {str(e)}')
-                            except Exception as e:
-                                print(f'    . Could not check network ports: {str(e)}')
-                            
-                            self.conn.network.delete_network(id)
-                            self.report_deletion('NETWORK', name)
-                            break
+                        net.update_router(id, external_gateway_info=None)
+                        self.report_deletion('Router Gateway', name)
                     except Exception as e:
-                        if "NotFound" in str(type(e)) or "404" in str(e):
-                            self.report_not_found('NETWORK', name)
-                            break
-                        elif ("NetworkInUse" in str(type(e)) or "409" in str(e) or 
-                              "in use" in str(e).lower() or "ports still in use" in str(e).lower()):
-                            retry_count -= 1
-                            if retry_count > 0:
-                                print(f'    . Network {name} still has dependencies, retrying in 5 seconds... ({retry_count} retries left)')
-                                time.sleep(5)
-                            else:
-                                self.report_error('NETWORK', name, f'Still has dependencies after retries: {str(e)}')
-                        else:
-                            self.report_error('NETWORK', name, str(e))
-                            break
-        except KeyError:
-            pass
-
-        # Delete security groups last (after instances are gone)
-        if security_groups_to_delete:
-            if not self.dryrun:
-                print('    . Waiting a moment for instances to be fully deleted...')
-                time.sleep(5)  # Give instances time to be fully deleted
-            
-            for id, name in security_groups_to_delete:
-                retry_count = 3
-                while retry_count > 0:
+                        self.report_progress(f'Could not remove router gateway: {str(e)}')
+                        # Keep going anyway
+                
+                # Remove interfaces - the gateway and HA ports aren't interfaces, leave those alone
+                for port in self._router_interfaces(id):
+                    # For SDK, remove interfaces by subnet
                     try:
-                        if self.dryrun:
-                            self.conn.network.get_security_group(id)
-                            self.report_deletion('SECURITY GROUP', name)
-                            break
-                        else:
-                            self.conn.network.delete_security_group(id)
-                            self.report_deletion('SECURITY GROUP', name)
-                            break
+                        net.remove_interface_from_router(
+                            id, subnet_id=port.fixed_ips[0]['subnet_id']
+                        )
+                    except Exception:
+                        pass  # Interface might already be removed
+                
+                # Delete the router
+                net.delete_router(id)
+                self._deleted_router_ids.add(id)
+            self.report_deletion('ROUTER', name)
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('ROUTER', name)
+        except os_exceptions.ConflictException as e:
+            self.report_error('ROUTER', name, f'Conflict (may have dependencies): {str(e)}')
+        except Exception as e:
+            self.report_error('ROUTER', name, str(e))
+
+    def _router_interfaces(self, router_id):
+        """Get the router's interface ports (with an address) from the cached port listing."""
+        return [port for port in self._ports_by_device.get(router_id, [])
+                if port.device_owner in ROUTER_INTERFACE_OWNERS and port.fixed_ips]
+
+    def _delete_network(self, id, name):
+        """Clean up leftover ports on a network and delete it, retrying while it's in use."""
+        net = self.conn.network
+        retry_count = DEFAULT_RETRY_COUNT
+        remaining_ports = self._ports_by_network.get(id, [])
+        while retry_count > 0:
+            try:
+                if self.dryrun:
+                    net.get_network(id)
+                    self.report_deletion('NETWORK', name)
+                    break
+                else:
+                    # Let's see what ports are still hanging around and clean up what we can
+                    try:
+                        if remaining_ports is None:
+                            # Retrying, so the cached listing is stale - look again
+                            remaining_ports = list(net.ports(network_id=id))
+                        if remaining_ports:
+                            self.report_progress(f'Network {name} has {len(remaining_ports)} remaining ports, checking...')
+                            # Don't mess with system ports (they get cleaned up by their owners)
+                            stray_ports = [(port.id, port.name or port.id) for port in remaining_ports
+                                           if port.device_owner not in ['network:dhcp', 'network:router_interface',
+                                                                        'network:router_gateway', 'network:floatingip']]
+                            # Try to clean up the stragglers - one at a time, networks already run in parallel
+                            for port_id, port_name in stray_ports:
+                                self._delete_stray_port(port_id, port_name)
                     except Exception as e:
-                        if "NotFound" in str(type(e)) or "404" in str(e):
-                            self.report_not_found('SECURITY GROUP', name)
-                            break
-                        elif ("Conflict" in str(type(e)) or "409" in str(e) or 
-                              "in use" in str(e).lower()):
-                            retry_count -= 1
-                            if retry_count > 0:
-                                print(f'    . Security group {name} still in use, retrying in 5 seconds... ({retry_count} retries left)')
-                                time.sleep(5)
-                            else:
-                                self.report_error('SECURITY GROUP', name, f'Still in use after retries: {str(e)}')
-                        else:
-                            self.report_error('SECURITY GROUP', name, str(e))
-                            break
+                        self.report_progress(f'Could not check network ports: {str(e)}')
+                    
+                    net.delete_network(id)
+                    self.report_deletion('NETWORK', name)
+                    break
+            except os_exceptions.ResourceNotFound:
+                self.report_not_found('NETWORK', name)
+                break
+            except Exception as e:
+                if is_in_use_error(e):
+                    retry_count -= 1
+                    remaining_ports = None
+                    if retry_count > 0:
+                        delay = backoff_delay(DEFAULT_RETRY_COUNT - retry_count)
+                        self.report_progress(f'Network {name} still has dependencies, retrying in {delay:.1f} seconds... ({retry_count} retries left)')
+                        time.sleep(delay)
+                    else:
+                        self.report_error('NETWORK', name, f'Still has dependencies after retries: {str(e)}')
+                else:
+                    self.report_error('NETWORK', name, str(e))
+                    break
+
+    def _delete_stray_port(self, port_id, port_name):
+        """Delete a leftover port blocking a network delete, a port that's already gone is fine."""
+        try:
+            self.report_progress(f'Deleting remaining port {port_name}...')
+            self.conn.network.delete_port(port_id)
+        except os_exceptions.ResourceNotFound:
+            pass
+        except Exception as e:
+            self.report_progress(f'Could not delete port {port_id}: {str(e)}')
+
+    def _delete_security_group(self, id, name):
+        """Delete a security group, retrying while it's still in use."""
+        net = self.conn.network
+        retry_count = DEFAULT_RETRY_COUNT
+        while retry_count > 0:
+            try:
+                if self.dryrun:
+                    if self._existing_sg_ids is None:
+                        net.get_security_group(id)
+                    elif id not in self._existing_sg_ids:
+                        raise os_exceptions.ResourceNotFound()
+                    self.report_deletion('SECURITY GROUP', name)
+                    break
+                else:
+                    net.delete_security_group(id)
+                    self.report_deletion('SECURITY GROUP', name)
+                    break
+            except os_exceptions.ResourceNotFound:
+                self.report_not_found('SECURITY GROUP', name)
+                break
+            except Exception as e:
+                if is_in_use_error(e):
+                    retry_count -= 1
+                    if retry_count > 0:
+                        delay = backoff_delay(DEFAULT_RETRY_COUNT - retry_count)
+                        self.report_progress(f'Security group {name} still in use, retrying in {delay:.1f} seconds... ({retry_count} retries left)')
+                        time.sleep(delay)
+                    else:
+                        self.report_error('SECURITY GROUP', name, f'Still in use after retries: {str(e)}')
+                else:
+                    self.report_error('SECURITY GROUP', name, str(e))
+                    break
 
 class LoadBalancerCleaner(AbstractCleaner):
 
-    def __init__(self, sess, resources, dryrun):
-        self.session = sess
+    def __init__(self, conn, resources, dryrun, name_re, delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
         self.monitor = None  # Will be set by OpenStackCleaners
-        
-        # Initialize OpenStack SDK connection
-        self.conn = openstack.connection.Connection(session=sess)
+        self.conn = conn
         
         def loadbalancers_fetcher():
-            return list(self.conn.load_balancer.load_balancers())
+            return self.conn.load_balancer.load_balancers()
 
         res_desc = {
             'loadbalancers': [loadbalancers_fetcher]
         }
-        super(LoadBalancerCleaner, self).__init__('LoadBalancer', res_desc, resources, dryrun)
+        super(LoadBalancerCleaner, self).__init__('LoadBalancer', res_desc, resources, dryrun,
+                                                  name_re, delete_concurrency)
     
     def set_monitor(self, monitor):
         """Hook up the progress monitor so we can track what's happening"""
         self.monitor = monitor
 
     def clean(self):
-        print('*** LOAD BALANCER cleanup')
+        LOG.info('*** LOAD BALANCER cleanup')
         
         # For Load Balancers, it's often better to delete the entire LB with cascade
         # This avoids issues with individual component deletion when LB is in PENDING_UPDATE state
         
         # Delete load balancers first with cascade - this should take care of listeners and pools too
-        try:
-            for id, name in self.resources.get('loadbalancers', {}).items():
-                retry_count = DEFAULT_RETRY_COUNT
-                while retry_count > 0:
+        self._parallel_delete(self.resources.get('loadbalancers', {}).items(), self._delete_load_balancer)
+
+    def _delete_load_balancer(self, id, name):
+        """Cascade delete a load balancer, waiting out PENDING_* states and conflicts."""
+        lb_api = self.conn.load_balancer
+        retry_count = DEFAULT_RETRY_COUNT
+        while retry_count > 0:
+            try:
+                if self.dryrun:
+                    self.report_deletion('LOAD BALANCER', name)
+                    break
+                else:
+                    # Check what state this load balancer is in
                     try:
-                        if self.dryrun:
-                            self.report_deletion('LOAD BALANCER', name)
-                            break
-                        else:
-                            # Check what state this load balancer is in
-                            try:
-                                lb = self.conn.load_balancer.get_load_balancer(id)
-                                if lb.provisioning_status in ['PENDING_UPDATE', 'PENDING_CREATE', 'PENDING_DELETE']:
-                                    print(f'    . Load balancer {name} is in {lb.provisioning_status} state, waiting...')
-                                    retry_count -= 1
-                                    if retry_count > 0:
-                                        time.sleep(DEFAULT_LB_RETRY_DELAY)
-                                        continue
-                                    else:
-                                        self.report_error('LOAD BALANCER', name, f'Still in {lb.provisioning_status} state after retries')
-                                        break
-                            except os_exceptions.ResourceNotFound:
-                                self.report_not_found('LOAD BALANCER', name)
-                                break
-                            
-                            # Try cascade delete (should handle dependencies automatically)
-                            self.conn.load_balancer.delete_load_balancer(id, cascade=True)
-                            self.report_deletion('LOAD BALANCER', name)
-                            
-                            # Double check it's really gone if we have a monitor
-                            if self.monitor:
-                                self.monitor.verify_resource_deleted('LOAD BALANCER', id)
-                            break
-                            
-                    except os_exceptions.ResourceNotFound:
-                        self.report_not_found('LOAD BALANCER', name)
-                        break
-                    except Exception as e:
-                        if "ConflictException" in str(type(e)) or "409" in str(e):
+                        lb = lb_api.get_load_balancer(id)
+                        if lb.provisioning_status in ['PENDING_UPDATE', 'PENDING_CREATE', 'PENDING_DELETE']:
+                            self.report_progress(f'Load balancer {name} is in {lb.provisioning_status} state, waiting...')
                             retry_count -= 1
                             if retry_count > 0:
-                                print(f'    . Load balancer {name} conflict, retrying in {DEFAULT_LB_RETRY_DELAY} seconds... ({retry_count} retries left)')
                                 time.sleep(DEFAULT_LB_RETRY_DELAY)
+                                continue
                             else:
-                                self.report_error('LOAD BALANCER', name, f'Conflict after retries: {str(e)}')
-                        else:
-                            self.report_error('LOAD BALANCER', name, str(e))
-                            break
-        except KeyError:
-            pass
+                                self.report_error('LOAD BALANCER', name, f'Still in {lb.provisioning_status} state after retries')
+                                break
+                    except os_exceptions.ResourceNotFound:
+                        self.report_not_found('LOAD BALANCER', name)
+                        break
+                    
+                    # Try cascade delete (should handle dependencies automatically)
+                    lb_api.delete_load_balancer(id, cascade=True)
+                    self.report_deletion('LOAD BALANCER', name)
+                    
+                    # Double check it's really gone if we have a monitor
+                    if self.monitor:
+                        self.monitor.verify_resource_deleted('LOAD BALANCER', id)
+                    break
+                    
+            except os_exceptions.ResourceNotFound:
+                self.report_not_found('LOAD BALANCER', name)
+                break
+            except os_exceptions.ConflictException as e:
+                retry_count -= 1
+                if retry_count > 0:
+                    delay = backoff_delay(DEFAULT_RETRY_COUNT - retry_count)
+                    self.report_progress(f'Load balancer {name} conflict, retrying in {delay:.1f} seconds... ({retry_count} retries left)')
+                    time.sleep(delay)
+                else:
+                    self.report_error('LOAD BALANCER', name, f'Conflict after retries: {str(e)}')
+            except Exception as e:
+                self.report_error('LOAD BALANCER', name, str(e))
+                break
 
 class AdvancedServicesCleaner(AbstractCleaner):
     """
     Cleaner for additional OpenStack services like DNS, VPN, Firewall, etc.
     """
 
-    def __init__(self, sess, resources, dryrun):
-        self.session = sess
-        
-        # Initialize OpenStack SDK connection
-        self.conn = openstack.connection.Connection(session=sess)
+    def __init__(self, conn, resources, dryrun, name_re, delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
+        self.conn = conn
         
         # Try to import additional service clients
         self.available_services = {}
         
-        # Try DNS (Designate)
-        try:
-            # Test if DNS service is available via SDK
-            list(self.conn.dns.zones(limit=1))
-            self.available_services['dns'] = True
-        except Exception:
-            self.available_services['dns'] = False
-
-        # Try Heat (Orchestration)
-        try:
-            # Test if Heat service is available via SDK
-            list(self.conn.orchestration.stacks(limit=1))
-            self.available_services['heat'] = True
-        except Exception:
-            self.available_services['heat'] = False
+        # Check the service catalog for DNS (Designate) and Heat (Orchestration)
+        # endpoints instead of spending an API call on each to find out
+        self.available_services['dns'] = self.conn.has_service('dns')
+        self.available_services['heat'] = self.conn.has_service('orchestration')
 
         # VPN services are not commonly available in OpenStack SDK
         # Most deployments don't have VPN service, so we'll skip it
@@ -1008,84 +1215,89 @@ class AdvancedServicesCleaner(AbstractCleaner):
         
         if self.available_services.get('dns'):
             def zones_fetcher():
-                return list(self.conn.dns.zones())
+                return self.conn.dns.zones()
             res_desc['dns_zones'] = [zones_fetcher]
             
         if self.available_services.get('heat'):
             def stacks_fetcher():
-                all_stacks = list(self.conn.orchestration.stacks())
                 # Include all stacks regardless of status and ensure uniqueness by stack ID
-                unique_stacks = {}
-                for stack in all_stacks:
-                    unique_stacks[stack.id] = stack
-                return list(unique_stacks.values())
+                seen_ids = set()
+                for stack in self.conn.orchestration.stacks():
+                    if stack.id not in seen_ids:
+                        seen_ids.add(stack.id)
+                        yield stack
             res_desc['heat_stacks'] = [stacks_fetcher]
             
         # VPN services are not supported in this SDK-only version
 
-        super(AdvancedServicesCleaner, self).__init__('AdvancedServices', res_desc, resources, dryrun)
+        super(AdvancedServicesCleaner, self).__init__('AdvancedServices', res_desc, resources, dryrun,
+                                                      name_re, delete_concurrency)
 
     def clean(self):
         if not any(self.available_services.values()):
             return
             
-        print('*** ADVANCED SERVICES cleanup')
-        global resource_name_re
+        LOG.info('*** ADVANCED SERVICES cleanup')
 
         # Clean Heat stacks FIRST (they may have created DNS zones)
         if self.available_services.get('heat'):
             try:
-                for stack_id, stack_name in self.resources.get('heat_stacks', {}).items():
-                    try:
-                        if self.dryrun:
-                            self.report_deletion('HEAT STACK', stack_name)
-                        else:
-                            # Delete stack and wait for completion
-                            print(f'    . Deleting Heat stack {stack_name} and waiting for completion...')
-                            # Get the stack object first
-                            stack = self.conn.orchestration.get_stack(stack_id)
-                            self.conn.orchestration.delete_stack(stack)
-                            self.conn.orchestration.wait_for_delete(stack)
-                            self.report_deletion('HEAT STACK', stack_name)
-                    except Exception as e:
-                        if "NotFound" in str(e):
-                            self.report_not_found('HEAT STACK', stack_name)
-                        else:
-                            self.report_error('HEAT STACK', stack_name, str(e))
-                            
+                # Stacks delete independently, so wait on all of them at once
+                self._parallel_delete(self.resources.get('heat_stacks', {}).items(), self._delete_stack)
             except Exception as e:
-                print(f'    . Could not clean Heat stacks: {str(e)}')
+                LOG.info(f'    . Could not clean Heat stacks: {str(e)}')
 
         # Clean DNS zones AFTER Heat stacks
         if self.available_services.get('dns'):
             try:
-                for zone_id, zone_name in self.resources.get('dns_zones', {}).items():
-                    try:
-                        if self.dryrun:
-                            self.report_deletion('DNS ZONE', zone_name)
-                        else:
-                            self.conn.dns.delete_zone(zone_id)
-                            self.report_deletion('DNS ZONE', zone_name)
-                    except Exception as e:
-                        if "NotFound" in str(e):
-                            self.report_not_found('DNS ZONE', zone_name)
-                        else:
-                            self.report_error('DNS ZONE', zone_name, str(e))
+                self._parallel_delete(self.resources.get('dns_zones', {}).items(), self._delete_zone)
             except Exception as e:
-                print(f'    . Could not clean DNS zones: {str(e)}')
+                LOG.info(f'    . Could not clean DNS zones: {str(e)}')
+
+    def _delete_stack(self, stack_id, stack_name):
+        """Delete a single Heat stack and wait for the delete to complete."""
+        try:
+            if self.dryrun:
+                self.report_deletion('HEAT STACK', stack_name)
+            else:
+                self.report_progress(f'Deleting Heat stack {stack_name} and waiting for completion...')
+                # Get the stack object first
+                stack = self.conn.orchestration.get_stack(stack_id)
+                self.conn.orchestration.delete_stack(stack)
+                self.conn.orchestration.wait_for_delete(stack, interval=DEFAULT_STACK_DELETE_POLL_INTERVAL,
+                                                        wait=DEFAULT_STACK_DELETE_TIMEOUT)
+                self.report_deletion('HEAT STACK', stack_name)
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('HEAT STACK', stack_name)
+        except Exception as e:
+            self.report_error('HEAT STACK', stack_name, str(e))
+
+    def _delete_zone(self, zone_id, zone_name):
+        """Delete a single DNS zone and report what happened."""
+        try:
+            if self.dryrun:
+                self.report_deletion('DNS ZONE', zone_name)
+            else:
+                self.conn.dns.delete_zone(zone_id)
+                self.report_deletion('DNS ZONE', zone_name)
+        except os_exceptions.ResourceNotFound:
+            self.report_not_found('DNS ZONE', zone_name)
+        except Exception as e:
+            self.report_error('DNS ZONE', zone_name, str(e))
 
 class OpenStackCleaners():
 
-    def __init__(self, creds_obj, resources, dryrun):
+    def __init__(self, conn, resources, dryrun, name_re, delete_concurrency=DEFAULT_DELETE_CONCURRENCY):
         self.cleaners = []
         self.dryrun = dryrun
-        sess = creds_obj.get_session()
+        # Make sure the cleaners' reports are shown, even when main() didn't run
+        setup_logging()
         
         # Initialize resource monitor
-        self.monitor = ResourceMonitor(sess, dryrun)
+        self.monitor = ResourceMonitor(conn, dryrun)
         
         for cleaner_type in [AdvancedServicesCleaner, ComputeCleaner, StorageCleaner, LoadBalancerCleaner, NetworkCleaner]:
-            cleaner = cleaner_type(sess, resources, dryrun)
+            cleaner = cleaner_type(conn, resources, dryrun, name_re, delete_concurrency)
             # Pass monitor to cleaner if it supports it
             if hasattr(cleaner, 'set_monitor'):
                 cleaner.set_monitor(self.monitor)
@@ -1106,8 +1318,15 @@ class OpenStackCleaners():
         return count
 
     def clean(self):
+        deleted_instances = 0
         for cleaner in self.cleaners:
+            # Pass the compute results on to cleaners that depend on them
+            if hasattr(cleaner, 'set_deleted_instances'):
+                cleaner.set_deleted_instances(deleted_instances)
             cleaner.clean()
+            if isinstance(cleaner, ComputeCleaner):
+                deleted_instances += cleaner.deleted_instances
+            flush_log()
 
 # Here's how we store what needs to be cleaned up:
 # First level keys are service types like: flavors, keypairs, users, routers, floating_ips, instances, volumes, etc.
@@ -1116,25 +1335,45 @@ class OpenStackCleaners():
 def get_resources_from_cleanup_log(logfile):
     """Load cleanup targets from a log file - expects lines with 'type|name|id' format"""
     resources = {}
-    with open(logfile) as ff:
-        content = ff.readlines()
-        for line in content:
-            tokens = line.strip().split('|')
-            restype = tokens[0]
-            resname = tokens[1]
-            resid = tokens[2]
+    # Stream the file in large chunks rather than reading it all into a list
+    with open(logfile, buffering=1 << 20) as ff:
+        for line in ff:
+            line = line.strip()
+            if not line:
+                continue
+            restype, resname, resid, *_ = line.split('|', 3)
             if not resid:
                 # normally only the keypairs have no ID
                 if restype != "keypairs":
                     print(f'Error: resource type {restype} has no ID - ignored!!!')
-                else:
-                    resid = '0'
-            if restype not in resources:
-                resources[restype] = {}
-            tres = resources[restype]
-            tres[resid] = resname
+                    continue
+                resid = '0'
+            resources.setdefault(restype, {})[resid] = resname
     return resources
 
+class SubstringFilter:
+    """Match names that contain a fixed string.
+
+    Provides the same search() call as a compiled regex, for filters that
+    have no regex syntax left once simplified, like the default one.
+    """
+
+    def __init__(self, literal):
+        self.literal = literal
+
+    def search(self, text):
+        return self.literal in text
+
+def compile_filter(pattern):
+    """Build the name matcher for a --filter pattern.
+
+    Plain substring checks are much cheaper than running the regex engine,
+    so patterns without any regex special characters skip it.
+    """
+    pattern = simplify_filter(pattern)
+    if REGEX_SPECIAL_CHARS.isdisjoint(pattern):
+        return SubstringFilter(pattern)
+    return re.compile(pattern)
 
 def main():
     parser = argparse.ArgumentParser(description='OpenStack Resource Cleanup Tool')
@@ -1165,6 +1404,13 @@ def main():
                         action='store_true',
                         default=False,
                         help='automatic yes to prompts; assume "yes" as answer to all prompts')
+    parser.add_argument('--delete-concurrency', dest='delete_concurrency',
+                        action='store', type=int,
+                        default=DEFAULT_DELETE_CONCURRENCY,
+                        help='number of delete requests to run in parallel '
+                             f'({MIN_DELETE_CONCURRENCY}-{MAX_DELETE_CONCURRENCY}, '
+                             f'default:{DEFAULT_DELETE_CONCURRENCY})',
+                        metavar='<count>')
     opts = parser.parse_args()
 
     # Validate mutual exclusivity
@@ -1173,6 +1419,13 @@ def main():
         print("   Use either --rc for openrc file OR --cloud for clouds.yaml")
         return 1
 
+    if not MIN_DELETE_CONCURRENCY <= opts.delete_concurrency <= MAX_DELETE_CONCURRENCY:
+        print(f"❌ ERROR: --delete-concurrency must be between "
+              f"{MIN_DELETE_CONCURRENCY} and {MAX_DELETE_CONCURRENCY}")
+        return 1
+
+    setup_logging()
+
     print("🧹 OpenStack Resource Cleanup Tool")
     print("=" * 50)
     if opts.dryrun:
@@ -1235,19 +1488,20 @@ def main():
     else:
         # No file means we'll discover resources by scanning OpenStack and matching names
         resources = None
-    global resource_name_re
     if opts.filter:
         try:
-            resource_name_re = re.compile(opts.filter)
+            name_re = compile_filter(opts.filter)
         except Exception as exc:
             print('Provided filter is not a valid python regular expression: ' + opts.filter)
             print(str(exc))
             return 1
     else:
-        resource_name_re = re.compile('.*test-cluster.*')
+        name_re = compile_filter('.*test-cluster.*')
 
 
-    cleaners = OpenStackCleaners(cred, resources, opts.dryrun)
+    # One connection for everything, so endpoints are discovered only once
+    conn = cred.get_connection()
+    cleaners = OpenStackCleaners(conn, resources, opts.dryrun, name_re, opts.delete_concurrency)
 
     if opts.dryrun:
         print()